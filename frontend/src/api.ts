@@ -1,4 +1,4 @@
-import type { Task, TaskCreate, TaskLog, LogListResponse } from './types'
+import type { Task, TaskCreate, TaskListResponse, TaskLog, LogListResponse } from './types'
 
 const BASE_URL = '/api'
 
@@ -24,7 +24,7 @@ async function request<T>(url: string, options?: RequestInit): Promise<T> {
 }
 
 // Tasks
-export async function getTasks(): Promise<{ tasks: Task[]; total: number }> {
+export async function getTasks(): Promise<TaskListResponse> {
   return request('/tasks')
 }
 
@@ -85,7 +85,7 @@ export async function getLog(id: string): Promise<TaskLog> {
 
 // System
 export async function getSystemStatus(): Promise<{
-  scheduler: { running: boolean; scheduled_jobs: number }
+  scheduler: { running: boolean; paused: boolean; scheduled_jobs: number }
   running_tasks: Record<string, string>
   sse_subscribers: number
   config: { telegram_configured: boolean; openai_configured: boolean }
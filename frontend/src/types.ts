@@ -6,6 +6,7 @@ export interface Task {
   timezone: string
   is_enabled: boolean
   timeout_seconds: number
+  cache_ttl_seconds: number
   headless: boolean
   start_url: string | null
   telegram_enabled: boolean
@@ -24,6 +25,7 @@ export interface TaskCreate {
   cron_expression?: string | null
   timezone?: string
   timeout_seconds?: number
+  cache_ttl_seconds?: number
   headless?: boolean
   start_url?: string | null
   telegram_enabled?: boolean
@@ -32,6 +34,14 @@ export interface TaskCreate {
   notify_on_failure?: boolean
 }
 
+export interface TaskListResponse {
+  tasks: Task[]
+  total: number
+  page: number
+  per_page: number
+  total_pages: number
+}
+
 export interface TaskLog {
   id: string
   task_id: string
@@ -48,10 +58,10 @@ export interface TaskLog {
 
 export interface LogListResponse {
   logs: TaskLog[]
-  total: number
+  total: number | null
   page: number
   per_page: number
-  total_pages: number
+  total_pages: number | null
 }
 
 export interface SSEEvent {
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Run the task scheduler in a dedicated process.
+
+Use together with RUN_SCHEDULER_IN_API=false so API workers only manage the
+shared job store while this process executes the jobs.
+"""
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import settings
+from src.db import init_db
+from src.services.scheduler_service import scheduler_service, acquire_scheduler_lock
+from src.services.notification_service import notification_service
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    """Execute scheduled tasks until interrupted or terminated."""
+    await init_db()
+
+    lock = acquire_scheduler_lock(settings.database_path.with_suffix(".scheduler.lock"))
+    if lock is None:
+        logger.error("Scheduler is already running in another process")
+        sys.exit(1)
+
+    # Shut down cleanly on SIGTERM (systemd, Docker) as well as Ctrl+C
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await scheduler_service.start()
+    try:
+        await stop.wait()
+    finally:
+        await scheduler_service.stop()
+        await notification_service.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
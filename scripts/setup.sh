@@ -149,7 +149,7 @@ User=$USER
 WorkingDirectory=$PROJECT_DIR
 Environment="PATH=$UV_DIR:$HOME/.local/bin:$HOME/.cargo/bin:/usr/local/bin:/usr/bin:/bin"
 Environment="PYTHONPATH="
-ExecStart=$UV_PATH run uvicorn src.main:app --host 0.0.0.0 --port 8000
+ExecStart=$UV_PATH run uvicorn src.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 Restart=always
 RestartSec=10
 
@@ -1,20 +1,44 @@
 """FastAPI application factory."""
 import logging
+import re
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+from starlette.responses import Response
+from starlette.types import Scope
 
+from src.config import settings
 from src.db import init_db
-from src.services.scheduler_service import scheduler_service
+from src.services.scheduler_service import scheduler_service, acquire_scheduler_lock
 from src.services.event_manager import event_manager
 from src.services.notification_service import notification_service
 from src.api.routers import tasks_router, logs_router, events_router, system_router
 
 logger = logging.getLogger(__name__)
 
+# Vite build output names bundles like "assets/index-B2c9xQ1a.js"
+_HASHED_ASSET = re.compile(r"-[\w-]{8,}\.\w+$")
+
+
+class FrontendStaticFiles(StaticFiles):
+    """Static files with cache headers suited to the Vite build output."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a file, marking content-hashed assets as immutable."""
+        response = await super().get_response(path, scope)
+
+        parts = Path(path).parts
+        if parts and parts[0] == "assets" and _HASHED_ASSET.search(parts[-1]):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            # Revalidate index.html so new bundle names are picked up after a deploy
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -27,16 +51,28 @@ async def lifespan(app: FastAPI):
     logger.info("Database initialized")
 
     # Set up event manager for scheduler
+    event_manager.start()
     scheduler_service.set_event_manager(event_manager)
 
-    # Start scheduler
-    await scheduler_service.start()
+    # Execute jobs in only one process; the lock is held until exit
+    app.state.scheduler_lock = None
+    if settings.run_scheduler_in_api:
+        app.state.scheduler_lock = acquire_scheduler_lock(
+            settings.database_path.with_suffix(".scheduler.lock")
+        )
+
+    if app.state.scheduler_lock is not None:
+        await scheduler_service.start()
+    else:
+        logger.info("Scheduler running in another process, jobs will not run here")
+        await scheduler_service.start(paused=True)
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
     await scheduler_service.stop()
+    event_manager.stop()
     await notification_service.close()
 
 
@@ -58,6 +94,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger responses (log pages, frontend bundles); SSE streams are excluded
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # API routers
     app.include_router(tasks_router, prefix="/api")
     app.include_router(logs_router, prefix="/api")
@@ -67,6 +106,6 @@ def create_app() -> FastAPI:
     # Serve frontend static files if available
     frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
     if frontend_dist.exists():
-        app.mount("/", StaticFiles(directory=str(frontend_dist), html=True), name="frontend")
+        app.mount("/", FrontendStaticFiles(directory=str(frontend_dist), html=True), name="frontend")
 
     return app
@@ -1,5 +1,7 @@
 """Server-Sent Events endpoint for real-time updates."""
-from fastapi import APIRouter
+from contextlib import aclosing
+
+from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
 
 from src.services.event_manager import event_manager
@@ -8,6 +10,17 @@ router = APIRouter(tags=["events"])
 
 
 @router.get("/events")
-async def events():
+async def events(request: Request):
     """SSE endpoint for real-time task status updates."""
-    return EventSourceResponse(event_manager.subscribe())
+
+    async def stream():
+        async with aclosing(event_manager.subscribe()) as subscription:
+            async for frames in subscription:
+                if await request.is_disconnected():
+                    break
+                # Frames arrive already encoded and are written as-is
+                yield frames
+
+    # Disable proxy buffering (nginx) so events are flushed immediately. Keepalives
+    # come from the event manager's shared timer, so the per-connection ping is off
+    return EventSourceResponse(stream(), headers={"X-Accel-Buffering": "no"}, ping=0)
@@ -1,30 +1,33 @@
 """Log query endpoints."""
-import json
 from math import ceil
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import get_db
+from src.db.models import decode_agent_steps
 from src.schemas.log import LogResponse, LogListResponse, LogStatus
 from src.services.log_service import LogService
+from src.services.task_service import TaskService
 
 router = APIRouter(prefix="/logs", tags=["logs"])
 
 
-def _log_to_response(log, task_name: str | None = None) -> LogResponse:
-    """Convert a log model to response schema."""
-    agent_steps = None
-    if log.agent_steps:
-        try:
-            agent_steps = json.loads(log.agent_steps)
-        except json.JSONDecodeError:
-            pass
+def _total_pages(total: int | None, per_page: int) -> int | None:
+    """Number of pages for a total, or None if it was not counted."""
+    if total is None:
+        return None
+    return ceil(total / per_page) if total > 0 else 1
+
 
+def _log_to_response(
+    log, task_name: str | None, agent_steps: list[dict] | None = None
+) -> LogResponse:
+    """Convert a log model to response schema."""
     return LogResponse(
         id=log.id,
         task_id=log.task_id,
-        task_name=task_name or (log.task.name if hasattr(log, "task") and log.task else None),
+        task_name=task_name,
         status=LogStatus(log.status),
         started_at=log.started_at,
         completed_at=log.completed_at,
@@ -42,6 +45,7 @@ async def list_logs(
     status: LogStatus | None = Query(default=None, description="Filter by status"),
     page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=25, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(default=True, description="Count all matching logs"),
     db: AsyncSession = Depends(get_db),
 ) -> LogListResponse:
     """List all logs with optional filters."""
@@ -53,16 +57,16 @@ async def list_logs(
         status=status,
         limit=per_page,
         offset=offset,
+        include_total=include_total,
+        load_task=True,
     )
 
-    total_pages = ceil(total / per_page) if total > 0 else 1
-
     return LogListResponse(
-        logs=[_log_to_response(log) for log in logs],
+        logs=[_log_to_response(log, task_name=log.task.name) for log in logs],
         total=total,
         page=page,
         per_page=per_page,
-        total_pages=total_pages,
+        total_pages=_total_pages(total, per_page),
     )
 
 
@@ -73,7 +77,7 @@ async def get_log(
 ) -> LogResponse:
     """Get a log by ID."""
     service = LogService(db)
-    log = await service.get_by_id(log_id)
+    log = await service.get_by_id(log_id, load_task=True)
 
     if not log:
         raise HTTPException(
@@ -81,7 +85,9 @@ async def get_log(
             detail="Log not found",
         )
 
-    return _log_to_response(log)
+    return _log_to_response(
+        log, task_name=log.task.name, agent_steps=decode_agent_steps(log.agent_steps)
+    )
 
 
 @router.get("/task/{task_id}", response_model=LogListResponse)
@@ -89,24 +95,27 @@ async def get_task_logs(
     task_id: str,
     page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=25, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(default=True, description="Count all matching logs"),
     db: AsyncSession = Depends(get_db),
 ) -> LogListResponse:
     """Get logs for a specific task."""
     service = LogService(db)
     offset = (page - 1) * per_page
 
+    # Every log belongs to the same task, so look its name up once instead of joining
+    task_name = await TaskService(db).get_name(task_id)
+
     logs, total = await service.get_all(
         task_id=task_id,
         limit=per_page,
         offset=offset,
+        include_total=include_total,
     )
 
-    total_pages = ceil(total / per_page) if total > 0 else 1
-
     return LogListResponse(
-        logs=[_log_to_response(log) for log in logs],
+        logs=[_log_to_response(log, task_name=task_name) for log in logs],
         total=total,
         page=page,
         per_page=per_page,
-        total_pages=total_pages,
+        total_pages=_total_pages(total, per_page),
     )
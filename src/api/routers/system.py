@@ -1,9 +1,11 @@
 """System status and health endpoints."""
-from fastapi import APIRouter
+import hashlib
+
+from fastapi import APIRouter, Request, Response
 
 from src.services.scheduler_service import scheduler_service
 from src.services.event_manager import event_manager
-from src.config import settings
+from src.config import settings_fast
 
 router = APIRouter(prefix="/system", tags=["system"])
 
@@ -14,15 +16,41 @@ async def health_check() -> dict:
     return {"status": "healthy"}
 
 
+def _status_etag(
+    running: bool, paused: bool, jobs: list, running_tasks: dict[str, str], subscribers: int
+) -> str:
+    """Build an ETag from the state reported by the status endpoint."""
+    state = (
+        running,
+        paused,
+        [(job.id, job.next_run_time) for job in jobs],
+        sorted(running_tasks.items()),
+        subscribers,
+        bool(settings_fast.telegram_bot_token),
+        bool(settings_fast.openai_api_key),
+    )
+    return f'"{hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()}"'
+
+
 @router.get("/status")
-async def system_status() -> dict:
+async def system_status(request: Request, response: Response) -> dict:
     """Get system status including scheduler and running tasks."""
-    jobs = scheduler_service.get_all_jobs()
+    jobs = await scheduler_service.get_all_jobs()
     running_tasks = scheduler_service.get_running_tasks()
+    running = scheduler_service.is_running
+    paused = scheduler_service.is_paused
+    subscribers = event_manager.subscriber_count
+
+    etag = _status_etag(running, paused, jobs, running_tasks, subscribers)
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
 
     return {
         "scheduler": {
-            "running": scheduler_service.scheduler.running,
+            "running": running,
+            "paused": paused,
             "scheduled_jobs": len(jobs),
             "jobs": [
                 {
@@ -33,9 +61,9 @@ async def system_status() -> dict:
             ],
         },
         "running_tasks": running_tasks,
-        "sse_subscribers": event_manager.subscriber_count,
+        "sse_subscribers": subscribers,
         "config": {
-            "telegram_configured": bool(settings.telegram_bot_token),
-            "openai_configured": bool(settings.openai_api_key),
+            "telegram_configured": bool(settings_fast.telegram_bot_token),
+            "openai_configured": bool(settings_fast.openai_api_key),
         },
     }
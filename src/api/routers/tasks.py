@@ -1,47 +1,94 @@
 """Task CRUD endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from math import ceil
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import get_db
 from src.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse
-from src.services.task_service import TaskService
+from src.services.task_service import TaskService, task_list_cache
 from src.services.scheduler_service import scheduler_service
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Task fields that affect the scheduler job
+_SCHEDULE_FIELDS = {"cron_expression", "timezone", "is_enabled"}
+
+
+def _json_response(content: BaseModel | bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Send a response model as JSON in a single serialization pass.
+
+    Returning a Response skips FastAPI's re-validation against response_model,
+    which is kept on the routes for the OpenAPI schema only.
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump_json().encode()
+    return Response(content=content, media_type="application/json", status_code=status_code)
+
 
 @router.get("", response_model=TaskListResponse)
-async def list_tasks(db: AsyncSession = Depends(get_db)) -> TaskListResponse:
-    """List all tasks."""
+async def list_tasks(
+    page: int | None = Query(default=None, ge=1, description="Page number"),
+    per_page: int | None = Query(default=None, ge=1, le=100, description="Items per page"),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List tasks, or all of them on one page when no paging is requested."""
+    cache_key = (page, per_page)
+    cached = task_list_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
     service = TaskService(db)
-    tasks = await service.get_all()
-    return TaskListResponse(
-        tasks=[TaskResponse.model_validate(t) for t in tasks],
-        total=len(tasks),
-    )
+
+    if page is None and per_page is None:
+        tasks = await service.get_all()
+        total = len(tasks)
+        page, per_page, total_pages = 1, max(total, 1), 1
+    else:
+        page = page or 1
+        per_page = per_page or 100
+        tasks = await service.get_all(limit=per_page, offset=(page - 1) * per_page)
+        total = await service.count()
+        total_pages = ceil(total / per_page) if total > 0 else 1
+
+    body = TaskListResponse.model_validate(
+        {
+            "tasks": tasks,
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "total_pages": total_pages,
+        },
+        from_attributes=True,
+    ).model_dump_json().encode()
+    task_list_cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Response:
     """Create a new task."""
     service = TaskService(db)
     task = await service.create(task_data)
     await db.commit()
+    task_list_cache.clear()
 
     # Schedule the task
     await scheduler_service.schedule_task(task)
 
-    return TaskResponse.model_validate(task)
+    return _json_response(TaskResponse.model_validate(task), status.HTTP_201_CREATED)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Response:
     """Get a task by ID."""
     service = TaskService(db)
     task = await service.get_by_id(task_id)
@@ -52,7 +99,7 @@ async def get_task(
             detail="Task not found",
         )
 
-    return TaskResponse.model_validate(task)
+    return _json_response(TaskResponse.model_validate(task))
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
@@ -60,23 +107,26 @@ async def update_task(
     task_id: str,
     task_data: TaskUpdate,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Response:
     """Update a task."""
     service = TaskService(db)
-    task = await service.update(task_id, task_data)
+    result = await service.update(task_id, task_data)
 
-    if not task:
+    if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
+    task, changed_fields = result
     await db.commit()
+    task_list_cache.clear()
 
-    # Reschedule the task
-    await scheduler_service.schedule_task(task)
+    # Reschedule only when the job itself is affected
+    if changed_fields & _SCHEDULE_FIELDS:
+        await scheduler_service.schedule_task(task)
 
-    return TaskResponse.model_validate(task)
+    return _json_response(TaskResponse.model_validate(task))
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -98,6 +148,7 @@ async def delete_task(
         )
 
     await db.commit()
+    task_list_cache.clear()
 
 
 @router.post("/{task_id}/run", response_model=dict)
@@ -130,7 +181,7 @@ async def run_task_now(
 async def toggle_task(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Response:
     """Toggle task enabled status."""
     service = TaskService(db)
     task = await service.toggle_enabled(task_id)
@@ -142,6 +193,7 @@ async def toggle_task(
         )
 
     await db.commit()
+    task_list_cache.clear()
 
     # Update scheduler
     if task.is_enabled:
@@ -149,14 +201,14 @@ async def toggle_task(
     else:
         await scheduler_service.unschedule_task(task_id)
 
-    return TaskResponse.model_validate(task)
+    return _json_response(TaskResponse.model_validate(task))
 
 
 @router.post("/{task_id}/duplicate", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def duplicate_task(
     task_id: str,
     db: AsyncSession = Depends(get_db),
-) -> TaskResponse:
+) -> Response:
     """Duplicate a task."""
     service = TaskService(db)
     original = await service.get_by_id(task_id)
@@ -168,25 +220,23 @@ async def duplicate_task(
         )
 
     # Create duplicate with modified name
-    duplicate_data = TaskCreate(
-        name=f"{original.name} (DUPLICATE)",
-        description=original.description,
-        cron_expression=original.cron_expression,
-        timezone=original.timezone,
-        timeout_seconds=original.timeout_seconds,
-        headless=original.headless,
-        start_url=original.start_url,
-        telegram_enabled=original.telegram_enabled,
-        telegram_chat_id=original.telegram_chat_id,
-        notify_on_success=original.notify_on_success,
-        notify_on_failure=original.notify_on_failure,
-    )
+    try:
+        duplicate_data = TaskCreate.model_validate(
+            {field: getattr(original, field) for field in TaskCreate.model_fields}
+            | {"name": f"{original.name} (DUPLICATE)"}
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=422,
+            detail=e.errors(include_url=False, include_context=False),
+        )
 
     new_task = await service.create(duplicate_data)
     await db.commit()
+    task_list_cache.clear()
 
     # Schedule if enabled and has cron
     if new_task.is_enabled and new_task.cron_expression:
         await scheduler_service.schedule_task(new_task)
 
-    return TaskResponse.model_validate(new_task)
+    return _json_response(TaskResponse.model_validate(new_task), status.HTTP_201_CREATED)
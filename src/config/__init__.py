@@ -1,4 +1,4 @@
 """Configuration module."""
-from .settings import settings
+from .settings import settings, settings_fast
 
-__all__ = ["settings"]
+__all__ = ["settings", "settings_fast"]
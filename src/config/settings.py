@@ -1,6 +1,7 @@
 """Application settings using Pydantic Settings."""
 from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -23,14 +24,32 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./data/browserautomation.db"
+    # With SQLite each pooled connection owns one aiosqlite worker thread, so the
+    # pool size is also the number of threads available for database calls
+    db_pool_size: int = 10  # Connections kept open for API, scheduler and SSE sessions
+    db_max_overflow: int = 20  # Extra connections allowed during bursts
 
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    reload: bool = False  # Auto-reload on code changes (development only)
+
+    # Scheduler
+    run_scheduler_in_api: bool = True  # False when scripts/run_scheduler.py executes jobs
+    scheduler_poll_interval: float = 10.0  # Seconds between checks for jobs added elsewhere
 
     # Browser
     browser_headless: bool = True
     browser_channel: str = "chrome"  # "chrome", "msedge", "chromium", or empty for bundled
+    browser_pool_size: int = 1  # Idle browsers kept running per headless/channel combination; 0 disables
+
+    # Caching
+    task_list_cache_ttl: float = 2.0  # Seconds a task list page may be served from memory
+
+    # Server-Sent Events
+    sse_max_queue_size: int = 1000  # Max pending events per subscriber
+    sse_queue_timeout: float = 5.0  # Seconds a full queue may stall before disconnecting
+    sse_keepalive_interval: float = 15.0  # Seconds between keepalive frames
 
     @property
     def database_path(self) -> Path:
@@ -49,3 +68,6 @@ def get_settings() -> Settings:
 
 
 settings = get_settings()
+
+# Plain-attribute snapshot of the validated settings for hot read paths
+settings_fast = SimpleNamespace(**settings.model_dump())
@@ -1,16 +1,66 @@
 """Database connection and session management."""
+import zlib
 from collections.abc import AsyncGenerator
 
+
+from sqlalchemy import Connection, DateTime, bindparam, case, event, func, inspect, or_, text, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn, DDLElement
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.config import settings
 
+
+def _pool_options() -> dict:
+    """Connection pool arguments for the configured database."""
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "sqlite":
+        return {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_pre_ping": True,
+        }
+    if url.database in (None, "", ":memory:"):
+        # In-memory databases live on a single shared connection
+        return {}
+    # One connection per concurrent session: each aiosqlite connection runs its
+    # own thread, and with WAL readers don't wait on the writer
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    **_pool_options(),
 )
 
+# Applied to every new SQLite connection: WAL lets API reads proceed while the
+# scheduler writes logs, and the larger page cache and mmap cut disk reads
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Tune a freshly opened SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -35,3 +85,99 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
+
+
+class _AddColumn(DDLElement):
+    """ALTER TABLE ... ADD COLUMN for a column defined on a model."""
+
+    def __init__(self, table, column):
+        """Initialize the statement."""
+        self.table = table
+        self.column = column
+
+
+@compiles(_AddColumn)
+def _compile_add_column(element: _AddColumn, compiler, **kw) -> str:
+    """Render the column as create_all() would, so types and defaults match the dialect."""
+    table = compiler.preparer.format_table(element.table)
+    column = compiler.process(CreateColumn(element.column), **kw)
+    return f"ALTER TABLE {table} ADD COLUMN {column}"
+
+
+def _upgrade_schema(connection: Connection) -> None:
+    """Bring databases created by older versions up to date."""
+    from .models import Base
+
+    # create_all() skips tables that already exist, including their new columns
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            default = getattr(column.server_default, "arg", None)
+            if default is not None and not isinstance(default, str):
+                # SQLite can only add columns with a constant default
+                raise RuntimeError(
+                    f"Cannot add column {table.name}.{column.name} with a SQL expression "
+                    "default; add it with a literal server_default or migrate by hand"
+                )
+            connection.execute(_AddColumn(table, column))
+
+    # ...and their new indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+    # One-time data rewrites; PRAGMA user_version counts how many have run
+    if connection.dialect.name == "sqlite":
+        version = connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+        for migrate in _DATA_MIGRATIONS[version:]:
+            migrate(connection)
+        if version < len(_DATA_MIGRATIONS):
+            connection.exec_driver_sql(f"PRAGMA user_version = {len(_DATA_MIGRATIONS)}")
+
+
+def _rewrite_iso_timestamps(connection: Connection) -> None:
+    """
+    Rewrite timestamps stored as ISO strings.
+
+    They used to have a "T" separator and an optional UTC offset; the
+    DateTime type stores the "YYYY-MM-DD HH:MM:SS" form.
+    """
+    from .models import Base
+
+    for table in Base.metadata.sorted_tables:
+        columns = [c for c in table.columns if isinstance(c.type, DateTime)]
+        if not columns:
+            continue
+        is_iso = {c: func.instr(c, "T") > 0 for c in columns}
+        connection.execute(
+            update(table)
+            .where(or_(*is_iso.values()))
+            .values({
+                c: case((is_iso[c], func.strftime("%Y-%m-%d %H:%M:%f", c)), else_=c)
+                for c in columns
+            })
+        )
+
+
+def _compress_agent_steps(connection: Connection) -> None:
+    """Compress agent steps stored as JSON text, like new rows."""
+    from .models import TaskLog
+
+    rows = connection.execute(
+        text("SELECT id, agent_steps FROM task_logs WHERE typeof(agent_steps) = 'text'")
+    ).all()
+    if rows:
+        connection.execute(
+            update(TaskLog.__table__)
+            .where(TaskLog.__table__.c.id == bindparam("log_id"))
+            .values(agent_steps=bindparam("steps")),
+            [{"log_id": id_, "steps": zlib.compress(raw.encode())} for id_, raw in rows],
+        )
+
+
+# Append only: a database's user_version is the number of these already applied
+_DATA_MIGRATIONS = [_rewrite_iso_timestamps, _compress_agent_steps]
@@ -1,8 +1,22 @@
 """SQLAlchemy ORM models."""
 import uuid
+import zlib
 from datetime import datetime
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, Text
+import orjson
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -11,9 +25,19 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def utc_now() -> str:
-    """Get current UTC time as ISO string."""
-    return datetime.utcnow().isoformat()
+def encode_agent_steps(steps: list[dict]) -> bytes:
+    """Serialize agent steps to the compressed form stored in TaskLog.agent_steps."""
+    return zlib.compress(orjson.dumps(steps))
+
+
+def decode_agent_steps(data: bytes | None) -> list[dict] | None:
+    """Deserialize stored agent steps, returning None if missing or unreadable."""
+    if not data:
+        return None
+    try:
+        return orjson.loads(zlib.decompress(data))
+    except (zlib.error, orjson.JSONDecodeError):
+        return None
 
 
 class Base(DeclarativeBase):
@@ -26,6 +50,15 @@ class Task(Base):
     """Task model for storing automation tasks."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # The scheduler loads enabled tasks, newest first; disabled ones stay out of the index
+        Index(
+            "ix_tasks_enabled_created_at",
+            "created_at",
+            sqlite_where=text("is_enabled = 1"),
+            postgresql_where=text("is_enabled"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -34,16 +67,22 @@ class Task(Base):
     timezone: Mapped[str] = mapped_column(String(50), default="UTC")
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     timeout_seconds: Mapped[int] = mapped_column(Integer, default=300)
+    cache_ttl_seconds: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     headless: Mapped[bool] = mapped_column(Boolean, default=True)
     start_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     telegram_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     telegram_chat_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     notify_on_success: Mapped[bool] = mapped_column(Boolean, default=False)
     notify_on_failure: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[str] = mapped_column(String(50), default=utc_now)
-    updated_at: Mapped[str] = mapped_column(String(50), default=utc_now, onupdate=utc_now)
-    last_run_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    next_run_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # All timestamps are naive UTC
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow
+    )
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    next_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     logs: Mapped[list["TaskLog"]] = relationship(
         "TaskLog", back_populates="task", cascade="all, delete-orphan"
@@ -54,18 +93,26 @@ class TaskLog(Base):
     """Task execution log model."""
 
     __tablename__ = "task_logs"
+    __table_args__ = (
+        # Log listings are filtered by task and/or status, newest first
+        Index("ix_task_logs_task_id_started_at", "task_id", "started_at"),
+        Index("ix_task_logs_status_started_at", "status", "started_at"),
+        Index("ix_task_logs_started_at", "started_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     task_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False
     )
     status: Mapped[str] = mapped_column(String(20), nullable=False)  # running, success, failure, timeout
-    started_at: Mapped[str] = mapped_column(String(50), nullable=False)
-    completed_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
     result_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    agent_steps: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array
-    created_at: Mapped[str] = mapped_column(String(50), default=utc_now)
+    agent_steps: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)  # zlib-compressed JSON array
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, server_default=func.now()
+    )
 
     task: Mapped["Task"] = relationship("Task", back_populates="logs")
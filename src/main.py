@@ -1,5 +1,7 @@
 """Application entry point."""
 import logging
+import sys
+
 import uvicorn
 
 from src.config import settings
@@ -16,11 +18,14 @@ app = create_app()
 
 def main() -> None:
     """Run the application."""
+    # uvloop is not available on Windows
     uvicorn.run(
         "src.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        reload=settings.reload,
     )
 
 
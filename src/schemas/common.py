@@ -0,0 +1,16 @@
+"""Shared Pydantic field types."""
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def _assume_utc(value: datetime) -> datetime:
+    """Mark naive datetimes read from the database as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+# Timestamps are stored as naive UTC; serialize them with an explicit offset
+UTCDateTime = Annotated[datetime, AfterValidator(_assume_utc)]
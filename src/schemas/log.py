@@ -3,6 +3,8 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+from .common import UTCDateTime
+
 
 class LogStatus(str, Enum):
     """Task log status enum."""
@@ -20,13 +22,13 @@ class LogResponse(BaseModel):
     task_id: str
     task_name: str | None = None
     status: LogStatus
-    started_at: str
-    completed_at: str | None
+    started_at: UTCDateTime
+    completed_at: UTCDateTime | None
     duration_seconds: float | None
     result_summary: str | None
     error_message: str | None
     agent_steps: list[dict] | None = Field(default=None)
-    created_at: str
+    created_at: UTCDateTime
 
     class Config:
         """Pydantic config."""
@@ -38,7 +40,7 @@ class LogListResponse(BaseModel):
     """Schema for log list response."""
 
     logs: list[LogResponse]
-    total: int
+    total: int | None  # None when the count was skipped
     page: int
     per_page: int
-    total_pages: int
+    total_pages: int | None
@@ -1,6 +1,8 @@
 """Task Pydantic schemas."""
 from pydantic import BaseModel, Field
 
+from .common import UTCDateTime
+
 
 class TaskBase(BaseModel):
     """Base task schema."""
@@ -10,6 +12,7 @@ class TaskBase(BaseModel):
     cron_expression: str | None = Field(default=None, max_length=100, description="Cron expression for scheduled runs. Leave empty for manual-only tasks.")
     timezone: str = Field(default="UTC", max_length=50)
     timeout_seconds: int = Field(default=300, ge=30, le=3600)
+    cache_ttl_seconds: int = Field(default=0, ge=0, le=86400, description="Reuse a successful scheduled result for this many seconds. 0 disables.")
     headless: bool = Field(default=True)
     start_url: str | None = Field(default=None, max_length=2048)
     telegram_enabled: bool = Field(default=True)
@@ -33,6 +36,7 @@ class TaskUpdate(BaseModel):
     timezone: str | None = Field(default=None, max_length=50)
     is_enabled: bool | None = None
     timeout_seconds: int | None = Field(default=None, ge=30, le=3600)
+    cache_ttl_seconds: int | None = Field(default=None, ge=0, le=86400)
     headless: bool | None = None
     start_url: str | None = Field(default=None, max_length=2048)
     telegram_enabled: bool | None = None
@@ -46,10 +50,10 @@ class TaskResponse(TaskBase):
 
     id: str
     is_enabled: bool
-    created_at: str
-    updated_at: str
-    last_run_at: str | None
-    next_run_at: str | None
+    created_at: UTCDateTime
+    updated_at: UTCDateTime
+    last_run_at: UTCDateTime | None
+    next_run_at: UTCDateTime | None
 
     class Config:
         """Pydantic config."""
@@ -62,3 +66,6 @@ class TaskListResponse(BaseModel):
 
     tasks: list[TaskResponse]
     total: int
+    page: int
+    per_page: int
+    total_pages: int
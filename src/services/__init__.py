@@ -4,6 +4,7 @@ from .log_service import LogService
 from .scheduler_service import SchedulerService
 from .notification_service import NotificationService
 from .agent_executor import AgentExecutor
+from .browser_pool import BrowserPool
 
 __all__ = [
     "TaskService",
@@ -11,4 +12,5 @@ __all__ = [
     "SchedulerService",
     "NotificationService",
     "AgentExecutor",
+    "BrowserPool",
 ]
@@ -1,16 +1,24 @@
 """AI Agent executor using browser-use library."""
 import asyncio
+import hashlib
 import logging
+import time
 from collections.abc import Callable
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
+
+import httpx
 from pydantic import BaseModel
 
-from browser_use import Agent, Browser, Controller
+from browser_use import Agent, Controller
 from browser_use.llm import ChatOpenAI
+from sqlalchemy import Row
 
 from src.config import settings
 from src.db.models import Task
 from src.schemas.log import LogStatus
+from src.services.browser_pool import browser_pool
 from src.services.notification_service import notification_service
 
 logger = logging.getLogger(__name__)
@@ -21,36 +29,61 @@ class SendTelegramMessage(BaseModel):
     message: str
 
 
-def create_controller(chat_id: str | None = None) -> Controller:
-    """Create a controller with custom actions including Telegram."""
-    controller = Controller()
-
-    @controller.action(
-        "Send a Telegram notification message to the user. Use this when you need to alert "
-        "the user about something important, like a price change, availability update, or "
-        "any condition that was requested to be monitored. You can format the message with "
-        "emojis and include any relevant data you found.",
-        param_model=SendTelegramMessage,
+# Chat for the Telegram action of the run in the current asyncio task
+_telegram_chat_id: ContextVar[str | None] = ContextVar("telegram_chat_id", default=None)
+
+# Built once; per-run state is passed through _telegram_chat_id
+_controller = Controller()
+
+
+@_controller.action(
+    "Send a Telegram notification message to the user. Use this when you need to alert "
+    "the user about something important, like a price change, availability update, or "
+    "any condition that was requested to be monitored. You can format the message with "
+    "emojis and include any relevant data you found.",
+    param_model=SendTelegramMessage,
+)
+async def send_telegram_notification(params: SendTelegramMessage) -> str:
+    """Send a custom Telegram message."""
+    if not notification_service.is_configured:
+        return "Telegram is not configured. Message not sent."
+
+    msg = params.message
+    success = await notification_service.send_message(
+        message=msg,
+        chat_id=_telegram_chat_id.get(),
     )
-    async def send_telegram_notification(params: SendTelegramMessage) -> str:
-        """Send a custom Telegram message."""
-        if not notification_service.is_configured:
-            return "Telegram is not configured. Message not sent."
-
-        msg = params.message
-        success = await notification_service.send_message(
-            message=msg,
-            chat_id=chat_id,
-        )
 
-        if success:
-            logger.info(f"Telegram message sent: {msg[:50]}...")
-            return "Telegram message sent successfully."
-        else:
-            logger.error("Failed to send Telegram message")
-            return "Failed to send Telegram message."
+    if success:
+        logger.info(f"Telegram message sent: {msg[:50]}...")
+        return "Telegram message sent successfully."
+    else:
+        logger.error("Failed to send Telegram message")
+        return "Failed to send Telegram message."
 
-    return controller
+
+def create_controller(chat_id: str | None = None) -> Controller:
+    """Get the controller with custom actions, sending Telegram messages to chat_id."""
+    _telegram_chat_id.set(chat_id)
+    return _controller
+
+
+@lru_cache(maxsize=512)
+def _compose_prompt(description: str, start_url: str | None, telegram_hint: bool) -> str:
+    """Compose an agent prompt; keyed on its inputs, so edited tasks get a fresh entry."""
+    prompt = description
+
+    if start_url:
+        prompt = f"Starting from {start_url}: {prompt}"
+
+    # Add hint about Telegram capability if enabled
+    if telegram_hint:
+        prompt += (
+            "\n\nNote: You have access to send_telegram_notification action to send "
+            "custom messages to the user. Use it when appropriate based on the task."
+        )
+
+    return prompt
 
 
 class AgentExecutor:
@@ -59,29 +92,51 @@ class AgentExecutor:
     def __init__(self):
         """Initialize the agent executor."""
         self._llm = None
+        self._http_client: httpx.AsyncClient | None = None
+        # task id -> (prompt hash, expires at, execute() result); successful runs only
+        self._result_cache: dict[str, tuple[str, float, tuple]] = {}
 
     @property
     def llm(self) -> ChatOpenAI:
         """Get or create LLM instance."""
         if self._llm is None:
+            # Shared across runs so connections to the API stay open between tasks
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=60,
+            )
             self._llm = ChatOpenAI(
                 model="gpt-4o",
                 api_key=settings.openai_api_key,
                 temperature=0.2,
+                http_client=self._http_client,
             )
         return self._llm
 
+    async def close(self) -> None:
+        """Close the shared LLM HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._llm = None
+
     async def execute(
         self,
-        task: Task,
+        task: Task | Row,
         on_step: Callable | None = None,
+        use_cache: bool = True,
     ) -> tuple[LogStatus, str | None, str | None, list[dict]]:
         """
         Execute a browser automation task.
 
+        A successful result is reused for tasks with cache_ttl_seconds set,
+        as long as the prompt is unchanged and the entry has not expired.
+
         Args:
             task: The task to execute
             on_step: Optional callback for step updates
+            use_cache: Whether a cached result may be returned instead of running
 
         Returns:
             Tuple of (status, result_summary, error_message, agent_steps)
@@ -91,86 +146,78 @@ class AgentExecutor:
         result_summary = None
         error_message = None
 
-        browser = None
-        try:
-            # Build the task prompt
-            prompt = self._build_prompt(task)
-
-            # Configure browser to use system Chrome
-            browser_kwargs = {
-                "headless": task.headless,
-            }
-
-            # Add channel if configured (chrome, msedge, etc.)
-            if settings.browser_channel:
-                browser_kwargs["channel"] = settings.browser_channel
+        # Build the task prompt
+        prompt = self._build_prompt(task)
 
-            browser = Browser(**browser_kwargs)
+        prompt_hash = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        if use_cache and task.cache_ttl_seconds > 0:
+            cached = self._result_cache.get(task.id)
+            if cached and cached[0] == prompt_hash and time.monotonic() < cached[1]:
+                logger.info(f"Task {task.id} reused a cached result")
+                return cached[2]
 
-            # Create controller with custom Telegram action
-            controller = create_controller(
-                chat_id=task.telegram_chat_id if task.telegram_enabled else None
-            )
+        try:
+            # Borrow a warm browser; one that errors or times out is killed, not reused
+            async with browser_pool.acquire(task.headless, settings.browser_channel) as browser:
+                # Create controller with custom Telegram action
+                controller = create_controller(
+                    chat_id=task.telegram_chat_id if task.telegram_enabled else None
+                )
 
-            # Create agent with browser and custom controller
-            agent = Agent(
-                task=prompt,
-                llm=self.llm,
-                browser=browser,
-                controller=controller,
-            )
+                # Create agent with browser and custom controller
+                agent = Agent(
+                    task=prompt,
+                    llm=self.llm,
+                    browser=browser,
+                    controller=controller,
+                )
 
-            # Execute with timeout
-            try:
+                # Execute with timeout
                 result = await asyncio.wait_for(
                     agent.run(),
                     timeout=task.timeout_seconds,
                 )
 
-                # Process result
-                if result:
-                    status = LogStatus.SUCCESS
-                    result_summary = self._extract_result_summary(result)
-                    steps = self._extract_steps(result)
-                else:
-                    status = LogStatus.FAILURE
-                    error_message = "Agent returned no result"
+            # Process result
+            if result:
+                status = LogStatus.SUCCESS
+                result_summary = self._extract_result_summary(result)
+                steps = self._extract_steps(result)
+            else:
+                status = LogStatus.FAILURE
+                error_message = "Agent returned no result"
 
-            except asyncio.TimeoutError:
-                status = LogStatus.TIMEOUT
-                error_message = f"Task timed out after {task.timeout_seconds} seconds"
-                logger.warning(f"Task {task.id} timed out")
+        except asyncio.TimeoutError:
+            status = LogStatus.TIMEOUT
+            error_message = f"Task timed out after {task.timeout_seconds} seconds"
+            logger.warning(f"Task {task.id} timed out")
 
         except Exception as e:
             status = LogStatus.FAILURE
             error_message = str(e)
             logger.error(f"Task {task.id} failed with error: {e}")
 
-        finally:
-            # Clean up browser
-            if browser:
-                try:
-                    await browser.stop()
-                except Exception as e:
-                    logger.warning(f"Failed to stop browser: {e}")
+        if status == LogStatus.SUCCESS and task.cache_ttl_seconds > 0:
+            now = time.monotonic()
+            # Drop expired entries, including those of tasks that no longer exist
+            self._result_cache = {
+                task_id: entry for task_id, entry in self._result_cache.items() if entry[1] > now
+            }
+            self._result_cache[task.id] = (
+                prompt_hash,
+                now + task.cache_ttl_seconds,
+                (status, result_summary, error_message, steps),
+            )
 
         return status, result_summary, error_message, steps
 
-    def _build_prompt(self, task: Task) -> str:
+    def _build_prompt(self, task: Task | Row) -> str:
         """Build the prompt for the AI agent."""
-        prompt = task.description
-
-        if task.start_url:
-            prompt = f"Starting from {task.start_url}: {prompt}"
-
-        # Add hint about Telegram capability if enabled
-        if task.telegram_enabled and notification_service.is_configured:
-            prompt += (
-                "\n\nNote: You have access to send_telegram_notification action to send "
-                "custom messages to the user. Use it when appropriate based on the task."
-            )
-
-        return prompt
+        return _compose_prompt(
+            task.description,
+            task.start_url,
+            task.telegram_enabled and notification_service.is_configured,
+        )
 
     def _extract_result_summary(self, result) -> str:
         """Extract a summary from the agent result."""
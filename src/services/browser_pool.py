@@ -0,0 +1,134 @@
+"""Pool of launched browsers reused across agent runs."""
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from browser_use import Browser
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+BrowserKey = tuple[bool, str | None]  # (headless, channel)
+
+
+class BrowserPool:
+    """Keeps idle browsers alive between runs so tasks skip the browser cold start."""
+
+    def __init__(self, max_idle: int = 1):
+        """Initialize the pool."""
+        self.max_idle = max_idle
+        self._idle: dict[BrowserKey, list[Browser]] = {}
+
+    @asynccontextmanager
+    async def acquire(self, headless: bool, channel: str | None = None) -> AsyncIterator[Browser]:
+        """
+        Borrow a started browser for the duration of the block.
+
+        The browser goes back to the pool, reset to a blank state, if the
+        block exits normally and it is still connected; after an error or
+        timeout it is killed instead.
+        """
+        key = (headless, channel or None)
+        browser = await self._take_idle(key) or await self._launch(key)
+
+        try:
+            yield browser
+        except BaseException:
+            await self._kill(browser)
+            raise
+
+        idle = self._idle.setdefault(key, [])
+        if browser.is_cdp_connected and len(idle) < self.max_idle and await self._reset(browser):
+            idle.append(browser)
+        else:
+            await self._kill(browser)
+
+    async def warm(self, headless: bool, channel: str | None = None) -> None:
+        """Launch a browser ahead of the first run."""
+        key = (headless, channel or None)
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.max_idle:
+            return
+        try:
+            idle.append(await self._launch(key))
+        except Exception as e:
+            logger.warning(f"Failed to warm browser pool: {e}")
+
+    async def close(self) -> None:
+        """Kill all idle browsers."""
+        idle, self._idle = self._idle, {}
+        for browsers in idle.values():
+            for browser in browsers:
+                await self._kill(browser)
+
+    async def _take_idle(self, key: BrowserKey) -> Browser | None:
+        """Pop a still-connected idle browser for the key, if any."""
+        idle = self._idle.get(key, [])
+        while idle:
+            browser = idle.pop()
+            if browser.is_cdp_connected:
+                return browser
+            await self._kill(browser)
+        return None
+
+    async def _launch(self, key: BrowserKey) -> Browser:
+        """Start a new browser that outlives individual agent runs."""
+        headless, channel = key
+        browser_kwargs = {"headless": headless, "keep_alive": True}
+        if channel:
+            browser_kwargs["channel"] = channel
+
+        browser = Browser(**browser_kwargs)
+        try:
+            await browser.start()
+        except BaseException:
+            await self._kill(browser)
+            raise
+        return browser
+
+    async def _reset(self, browser: Browser) -> bool:
+        """
+        Clear what a run left behind so the next task starts as in a new browser.
+
+        Opens a blank tab, closes every other tab, and deletes cookies and the
+        site data of every origin those tabs visited. Returns False if the
+        browser could not be reset and should not be reused.
+        """
+        try:
+            pages = await browser.get_pages()
+            origins: set[str] = set()
+            for page in pages:
+                history = await browser.cdp_client.send.Page.getNavigationHistory(
+                    session_id=await page.session_id
+                )
+                for entry in history["entries"]:
+                    url = urlsplit(entry["url"])
+                    if url.scheme in ("http", "https"):
+                        origins.add(f"{url.scheme}://{url.netloc}")
+
+            await browser.new_page("about:blank")
+            for page in pages:
+                await browser.close_page(page)
+
+            await browser.clear_cookies()
+            for origin in origins:
+                await browser.cdp_client.send.Storage.clearDataForOrigin(
+                    {"origin": origin, "storageTypes": "all"}
+                )
+        except Exception as e:
+            logger.warning(f"Failed to reset browser: {e}")
+            return False
+        return True
+
+    async def _kill(self, browser: Browser) -> None:
+        """Shut a browser down, ignoring errors from one that is already gone."""
+        try:
+            await browser.kill()
+        except Exception as e:
+            logger.warning(f"Failed to stop browser: {e}")
+
+
+# Global instance
+browser_pool = BrowserPool(max_idle=settings.browser_pool_size)
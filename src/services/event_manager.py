@@ -1,42 +1,121 @@
 """Server-Sent Events manager for real-time updates."""
 import asyncio
-import json
 import logging
+import time
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import orjson
+
+from src.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Queued in place of an event to tell a stalled subscriber to disconnect
+_DISCONNECT = object()
+
+# SSE comment sent periodically so proxies keep idle connections open
+_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# How long to wait after an event for others to arrive so a burst goes out in one write
+_COALESCE_WINDOW = 0.02
+
 
 class EventManager:
     """Manager for SSE connections and event broadcasting."""
 
     def __init__(self):
         """Initialize the event manager."""
-        self._queues: list[asyncio.Queue] = []
+        self._queues: set[asyncio.Queue[bytes | object]] = set()
+        self._stalled: dict[asyncio.Queue, float] = {}  # queue -> first overflow time
+        self._last_event_id = 0
+        self._keepalive_task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sending keepalive frames to all subscribers."""
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+    def stop(self) -> None:
+        """Stop sending keepalive frames."""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
 
-    async def subscribe(self) -> AsyncGenerator[str, None]:
-        """Subscribe to events and yield them as SSE format."""
-        queue: asyncio.Queue = asyncio.Queue()
-        self._queues.append(queue)
+    async def subscribe(self) -> AsyncGenerator[bytes, None]:
+        """
+        Subscribe to events and yield encoded SSE frames.
+
+        Events arriving in a short burst are joined so the caller can write
+        them in a single chunk. Keepalive comments from the shared timer are
+        yielded like events, which also gives the caller a regular chance to
+        check for client disconnects.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.sse_max_queue_size)
+        self._queues.add(queue)
 
         try:
             while True:
-                data = await queue.get()
-                yield f"data: {json.dumps(data)}\n\n"
+                item = await queue.get()
+                await asyncio.sleep(_COALESCE_WINDOW)
+                items = [item]
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+
+                self._stalled.pop(queue, None)
+                frames = b"".join(i for i in items if i is not _DISCONNECT)
+                if frames:
+                    yield frames
+                if _DISCONNECT in items:
+                    break
         except asyncio.CancelledError:
             pass
         finally:
-            self._queues.remove(queue)
+            self._remove(queue)
 
     async def broadcast(self, data: dict[str, Any]) -> None:
-        """Broadcast an event to all subscribers."""
-        for queue in self._queues:
+        """Broadcast an event to all subscribers without blocking on slow ones."""
+        self._last_event_id += 1
+        # Encode the SSE frame once and share it between all subscribers
+        frame = b"id: %d\ndata: %b\n\n" % (self._last_event_id, orjson.dumps(data))
+
+        for queue in list(self._queues):
             try:
-                await queue.put(data)
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._handle_full_queue(queue, frame)
             except Exception as e:
                 logger.error(f"Failed to broadcast to queue: {e}")
 
+    async def _keepalive_loop(self) -> None:
+        """Queue a keepalive comment for every subscriber on one shared timer."""
+        while True:
+            await asyncio.sleep(settings.sse_keepalive_interval)
+            for queue in list(self._queues):
+                try:
+                    queue.put_nowait(_KEEPALIVE_FRAME)
+                except asyncio.QueueFull:
+                    # A subscriber with a backlog has data to send already
+                    pass
+
+    def _handle_full_queue(self, queue: asyncio.Queue, frame: bytes) -> None:
+        """Drop the oldest event, disconnecting subscribers stalled for too long."""
+        now = time.monotonic()
+        stalled_since = self._stalled.setdefault(queue, now)
+        queue.get_nowait()
+
+        if now - stalled_since > settings.sse_queue_timeout:
+            logger.warning("Disconnecting SSE subscriber that stopped reading events")
+            self._remove(queue)
+            queue.put_nowait(_DISCONNECT)
+        else:
+            queue.put_nowait(frame)
+
+    def _remove(self, queue: asyncio.Queue) -> None:
+        """Stop delivering events to a queue."""
+        self._queues.discard(queue)
+        self._stalled.pop(queue, None)
+
     @property
     def subscriber_count(self) -> int:
         """Get the number of active subscribers."""
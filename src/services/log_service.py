@@ -1,15 +1,24 @@
 """Log management service."""
-import json
+import asyncio
 from datetime import datetime
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import DateTime, select, func, desc, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, joinedload
 
-from src.db.models import TaskLog, Task
+from src.db import async_session
+from src.db.models import TaskLog, Task, encode_agent_steps
 from src.schemas.log import LogStatus
 
 
+def _elapsed_seconds(dialect: str, start, end):
+    """SQL expression for the seconds between two timestamps."""
+    if dialect == "sqlite":
+        # julianday() is only accurate to a fraction of a millisecond
+        return func.round((func.julianday(end) - func.julianday(start)) * 86400, 3)
+    return func.extract("epoch", end - start)
+
+
 class LogService:
     """Service for task log operations."""
 
@@ -26,7 +35,7 @@ class LogService:
         log = TaskLog(
             task_id=task_id,
             status=status.value,
-            started_at=datetime.utcnow().isoformat(),
+            started_at=datetime.utcnow(),
         )
         self.db.add(log)
         await self.db.flush()
@@ -41,40 +50,47 @@ class LogService:
         error_message: str | None = None,
         agent_steps: list[dict] | None = None,
     ) -> TaskLog | None:
-        """Update a log entry."""
-        result = await self.db.execute(select(TaskLog).where(TaskLog.id == log_id))
-        log = result.scalar_one_or_none()
-
-        if not log:
-            return None
-
+        """Update a log entry in a single UPDATE ... RETURNING statement."""
+        values = {}
         if status is not None:
-            log.status = status.value
+            values["status"] = status.value
             if status != LogStatus.RUNNING:
-                log.completed_at = datetime.utcnow().isoformat()
-                if log.started_at:
-                    started = datetime.fromisoformat(log.started_at)
-                    completed = datetime.fromisoformat(log.completed_at)
-                    log.duration_seconds = (completed - started).total_seconds()
+                # Duration is computed by the database from the stored start time
+                completed_at = literal(datetime.utcnow(), DateTime)
+                values["completed_at"] = completed_at
+                values["duration_seconds"] = _elapsed_seconds(
+                    self.db.bind.dialect.name, TaskLog.started_at, completed_at
+                )
 
         if result_summary is not None:
-            log.result_summary = result_summary
+            values["result_summary"] = result_summary
         if error_message is not None:
-            log.error_message = error_message
+            values["error_message"] = error_message
         if agent_steps is not None:
-            log.agent_steps = json.dumps(agent_steps)
+            # Long step lists take a while to serialize and compress; keep the loop free
+            values["agent_steps"] = await asyncio.to_thread(encode_agent_steps, agent_steps)
 
-        await self.db.flush()
-        await self.db.refresh(log)
-        return log
+        if not values:
+            return await self.db.get(TaskLog, log_id)
 
-    async def get_by_id(self, log_id: str) -> TaskLog | None:
-        """Get a log by ID."""
         result = await self.db.execute(
-            select(TaskLog).options(joinedload(TaskLog.task)).where(TaskLog.id == log_id)
+            update(TaskLog)
+            .where(TaskLog.id == log_id)
+            .values(**values)
+            .returning(TaskLog)
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
+    async def get_by_id(self, log_id: str, load_task: bool = False) -> TaskLog | None:
+        """Get a log by ID, optionally with its task loaded in the same query."""
+        query = select(TaskLog).where(TaskLog.id == log_id)
+        if load_task:
+            query = query.options(joinedload(TaskLog.task, innerjoin=True))
+
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_by_task(
         self, task_id: str, limit: int = 50, offset: int = 0
     ) -> list[TaskLog]:
@@ -94,9 +110,19 @@ class LogService:
         status: LogStatus | None = None,
         limit: int = 25,
         offset: int = 0,
-    ) -> tuple[list[TaskLog], int]:
-        """Get all logs with optional filters."""
-        query = select(TaskLog).options(joinedload(TaskLog.task))
+        include_total: bool = True,
+        load_task: bool = False,
+    ) -> tuple[list[TaskLog], int | None]:
+        """
+        Get all logs with optional filters, with their task joined in if load_task is set.
+
+        The total is counted on a separate connection while the page loads, or
+        skipped (returned as None) when include_total is False. Agent steps are
+        not loaded; fetch a single log with get_by_id for those.
+        """
+        query = select(TaskLog).options(defer(TaskLog.agent_steps, raiseload=True))
+        if load_task:
+            query = query.options(joinedload(TaskLog.task, innerjoin=True))
         count_query = select(func.count(TaskLog.id))
 
         if task_id:
@@ -108,19 +134,33 @@ class LogService:
 
         query = query.order_by(desc(TaskLog.started_at)).limit(limit).offset(offset)
 
-        result = await self.db.execute(query)
-        logs = list(result.scalars().all())
+        if include_total:
+            result, total = await asyncio.gather(
+                self.db.execute(query), self._count(count_query)
+            )
+        else:
+            result, total = await self.db.execute(query), None
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar_one()
+        return list(result.scalars().all()), total
 
-        return logs, total
+    async def _count(self, count_query) -> int:
+        """Run a count query in its own session so it can overlap with this one."""
+        async with async_session() as db:
+            result = await db.execute(count_query)
+            return result.scalar_one()
+
+    async def get_running_for_task(
+        self, task_id: str, started_after: datetime | None = None
+    ) -> TaskLog | None:
+        """Get a running log for a task if it exists, optionally ignoring older ones."""
+        query = select(TaskLog).where(
+            TaskLog.task_id == task_id, TaskLog.status == LogStatus.RUNNING.value
+        )
+        if started_after is not None:
+            query = query.where(TaskLog.started_at > started_after)
 
-    async def get_running_for_task(self, task_id: str) -> TaskLog | None:
-        """Get a running log for a task if it exists."""
         result = await self.db.execute(
-            select(TaskLog)
-            .where(TaskLog.task_id == task_id, TaskLog.status == LogStatus.RUNNING.value)
+            query
             .order_by(desc(TaskLog.started_at))
             .limit(1)
         )
@@ -1,4 +1,5 @@
 """Telegram notification service."""
+import asyncio
 import logging
 from aiogram import Bot
 from aiogram.enums import ParseMode
@@ -7,6 +8,25 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Notification bodies, filled with %-formatting
+_SUCCESS_TMPL = "✅ <b>Task Completed Successfully</b>\n\n<b>Task:</b> %s\n<b>Duration:</b> %s"
+_FAILURE_TMPL = "❌ <b>Task Failed</b>\n\n<b>Task:</b> %s\n<b>Duration:</b> %s"
+_TIMEOUT_TMPL = (
+    "⏱️ <b>Task Timed Out</b>\n\n<b>Task:</b> %s\n<b>Timeout:</b> %ds\n\n"
+    "The task was terminated because it exceeded the configured timeout."
+)
+_RESULT_TMPL = "\n\n<b>Result:</b>\n%s"
+_ERROR_TMPL = "\n\n<b>Error:</b>\n<code>%s</code>"
+
+# Queued notifications for the same chat arriving within this window are sent together
+_BATCH_WINDOW = 1.0
+_BATCH_MAX_CHARS = 3500  # Telegram rejects messages over 4096 characters
+_BATCH_SEPARATOR = "\n\n➖➖➖\n\n"
+_SEND_INTERVAL = 1.0  # Telegram allows about one message per second per chat
+
+# Queued in place of a message to tell the send worker to flush and exit
+_STOP = object()
+
 
 class NotificationService:
     """Service for sending Telegram notifications."""
@@ -14,12 +34,20 @@ class NotificationService:
     def __init__(self):
         """Initialize the notification service."""
         self._bot: Bot | None = None
-
-    @property
-    def bot(self) -> Bot | None:
-        """Get or create bot instance."""
-        if self._bot is None and settings.telegram_bot_token:
-            self._bot = Bot(token=settings.telegram_bot_token)
+        self._bot_lock = asyncio.Lock()
+        self._send_queue: asyncio.Queue[tuple[str, str] | object] = asyncio.Queue()
+        self._send_worker: asyncio.Task | None = None
+
+    async def get_bot(self) -> Bot | None:
+        """Get or create the bot instance with its HTTP session open."""
+        if self._bot is not None or not settings.telegram_bot_token:
+            return self._bot
+
+        async with self._bot_lock:
+            if self._bot is None:
+                bot = Bot(token=settings.telegram_bot_token)
+                await bot.session.create_session()
+                self._bot = bot
         return self._bot
 
     @property
@@ -34,7 +62,8 @@ class NotificationService:
         parse_mode: ParseMode = ParseMode.HTML,
     ) -> bool:
         """Send a Telegram message."""
-        if not self.bot:
+        bot = await self.get_bot()
+        if not bot:
             logger.warning("Telegram bot not configured")
             return False
 
@@ -44,7 +73,7 @@ class NotificationService:
             return False
 
         try:
-            await self.bot.send_message(
+            await bot.send_message(
                 chat_id=target_chat,
                 text=message,
                 parse_mode=parse_mode,
@@ -54,6 +83,52 @@ class NotificationService:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
 
+    async def queue_message(self, message: str, chat_id: str | None = None) -> bool:
+        """Queue a message to be sent with others for the same chat, returning whether it was queued."""
+        if not settings.telegram_bot_token:
+            logger.warning("Telegram bot not configured")
+            return False
+
+        target_chat = chat_id or settings.telegram_chat_id
+        if not target_chat:
+            logger.warning("No Telegram chat ID configured")
+            return False
+
+        if self._send_worker is None or self._send_worker.done():
+            self._send_worker = asyncio.create_task(self._process_send_queue())
+        self._send_queue.put_nowait((target_chat, message))
+        return True
+
+    async def _process_send_queue(self) -> None:
+        """Send queued messages, combining those for the same chat that arrive together."""
+        while True:
+            batch = [await self._send_queue.get()]
+            if batch[0] is not _STOP:
+                await asyncio.sleep(_BATCH_WINDOW)
+            while not self._send_queue.empty():
+                batch.append(self._send_queue.get_nowait())
+
+            await self._send_batch([item for item in batch if item is not _STOP])
+            if _STOP in batch:
+                return
+
+    async def _send_batch(self, batch: list[tuple[str, str]]) -> None:
+        """Send a batch of (chat_id, message) pairs as few messages per chat as possible."""
+        by_chat: dict[str, list[str]] = {}
+        for chat_id, message in batch:
+            by_chat.setdefault(chat_id, []).append(message)
+
+        for chat_id, messages in by_chat.items():
+            combined = messages[0]
+            for message in messages[1:]:
+                if len(combined) + len(_BATCH_SEPARATOR) + len(message) > _BATCH_MAX_CHARS:
+                    await self.send_message(combined, chat_id)
+                    await asyncio.sleep(_SEND_INTERVAL)
+                    combined = message
+                else:
+                    combined += _BATCH_SEPARATOR + message
+            await self.send_message(combined, chat_id)
+
     async def notify_task_success(
         self,
         task_name: str,
@@ -64,15 +139,11 @@ class NotificationService:
         """Send a task success notification."""
         duration_str = f"{duration_seconds:.1f}s" if duration_seconds else "N/A"
 
-        message = f"""✅ <b>Task Completed Successfully</b>
-
-<b>Task:</b> {task_name}
-<b>Duration:</b> {duration_str}"""
-
+        message = _SUCCESS_TMPL % (task_name, duration_str)
         if result_summary:
-            message += f"\n\n<b>Result:</b>\n{result_summary[:500]}"
+            message += _RESULT_TMPL % result_summary[:500]
 
-        return await self.send_message(message, chat_id)
+        return await self.queue_message(message, chat_id)
 
     async def notify_task_failure(
         self,
@@ -84,15 +155,11 @@ class NotificationService:
         """Send a task failure notification."""
         duration_str = f"{duration_seconds:.1f}s" if duration_seconds else "N/A"
 
-        message = f"""❌ <b>Task Failed</b>
-
-<b>Task:</b> {task_name}
-<b>Duration:</b> {duration_str}"""
-
+        message = _FAILURE_TMPL % (task_name, duration_str)
         if error_message:
-            message += f"\n\n<b>Error:</b>\n<code>{error_message[:500]}</code>"
+            message += _ERROR_TMPL % error_message[:500]
 
-        return await self.send_message(message, chat_id)
+        return await self.queue_message(message, chat_id)
 
     async def notify_task_timeout(
         self,
@@ -101,17 +168,16 @@ class NotificationService:
         chat_id: str | None = None,
     ) -> bool:
         """Send a task timeout notification."""
-        message = f"""⏱️ <b>Task Timed Out</b>
-
-<b>Task:</b> {task_name}
-<b>Timeout:</b> {timeout_seconds}s
-
-The task was terminated because it exceeded the configured timeout."""
-
-        return await self.send_message(message, chat_id)
+        message = _TIMEOUT_TMPL % (task_name, timeout_seconds)
+        return await self.queue_message(message, chat_id)
 
     async def close(self) -> None:
-        """Close the bot session."""
+        """Send any queued messages and close the bot session."""
+        if self._send_worker and not self._send_worker.done():
+            self._send_queue.put_nowait(_STOP)
+            await self._send_worker
+        self._send_worker = None
+
         if self._bot:
             await self._bot.session.close()
             self._bot = None
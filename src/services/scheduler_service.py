@@ -1,96 +1,209 @@
 """APScheduler management service."""
+import asyncio
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_SUBMITTED, JobEvent
+from apscheduler.jobstores.base import ConflictingIdError, JobLookupError
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_PAUSED, STATE_RUNNING
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.job import Job
+from sqlalchemy import Row
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.db import async_session
 from src.db.models import Task
 from src.schemas.log import LogStatus
-from src.services.task_service import TaskService
+from src.services.task_service import TaskService, task_list_cache
 from src.services.log_service import LogService
 from src.services.agent_executor import agent_executor
+from src.services.browser_pool import browser_pool
+from src.services.cache import TTLCache
 from src.services.notification_service import notification_service
 
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; every process runs its own scheduler
+    fcntl = None
+
 if TYPE_CHECKING:
     from src.services.event_manager import EventManager
 
 logger = logging.getLogger(__name__)
 
+# How long the status endpoint may reuse the job list read from the job store
+_JOB_LIST_TTL = 2.0
+
+
+def acquire_scheduler_lock(lock_path: Path) -> int | None:
+    """
+    Try to take the cross-process scheduler lock.
+
+    Returns the file descriptor holding the lock, or None if another process
+    already owns it. Keep the descriptor open for the lifetime of the process;
+    the lock is released when it is closed or the process exits.
+    """
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is None:
+        return fd
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Convert an aware datetime to the naive UTC form stored in the database."""
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _job_store_url() -> str:
+    """Get a synchronous URL for the application database."""
+    url = make_url(settings.database_url)
+    return url.set(drivername=url.get_backend_name()).render_as_string(hide_password=False)
+
 
 class SchedulerService:
     """Service for managing scheduled tasks."""
 
     def __init__(self):
         """Initialize the scheduler service."""
-        self.scheduler = AsyncIOScheduler()
+        # Jobs live in the application database so every process sees the same schedule
+        self.scheduler = AsyncIOScheduler(
+            jobstores={"default": SQLAlchemyJobStore(url=_job_store_url())}
+        )
         self._event_manager: "EventManager | None" = None
         self._running_tasks: dict[str, str] = {}  # task_id -> log_id
+        self._active_jobs: set[str] = set()  # ids of jobs submitted and not yet finished
+        self.scheduler.add_listener(
+            self._track_job, EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+        )
+        self._poll_task: asyncio.Task | None = None
+        self._warm_task: asyncio.Task | None = None
+        self._job_list_cache = TTLCache(maxsize=1, ttl=_JOB_LIST_TTL)
 
     def set_event_manager(self, event_manager: "EventManager") -> None:
         """Set the event manager for SSE updates."""
         self._event_manager = event_manager
 
-    async def start(self) -> None:
-        """Start the scheduler and load all enabled tasks."""
-        self.scheduler.start()
+    async def start(self, paused: bool = False) -> None:
+        """
+        Start the scheduler and load all enabled tasks.
+
+        A paused scheduler only reads and writes the shared job store; the
+        process running an unpaused scheduler executes the jobs and owns
+        loading them at startup.
+        """
+        self.scheduler.start(paused=paused)
+        if paused:
+            logger.info("Scheduler started (paused)")
+            return
+
         logger.info("Scheduler started")
+        self._poll_task = asyncio.create_task(self._poll_job_store())
 
         # Load all enabled tasks
         async with async_session() as db:
             task_service = TaskService(db)
             tasks = await task_service.get_enabled()
 
+            # Reuse this session for the run time updates and commit them together
             for task in tasks:
-                await self.schedule_task(task)
+                await self.schedule_task(task, db=db)
+            await db.commit()
+            task_list_cache.clear()
 
             logger.info(f"Loaded {len(tasks)} enabled tasks")
 
+        # Open the Telegram session now rather than on the first notification
+        await notification_service.get_bot()
+
+        # Launch a browser for the default settings in the background, ready for the first run
+        self._warm_task = asyncio.create_task(
+            browser_pool.warm(settings.browser_headless, settings.browser_channel)
+        )
+
     async def stop(self) -> None:
         """Stop the scheduler."""
-        self.scheduler.shutdown(wait=False)
-        logger.info("Scheduler stopped")
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
 
-    async def schedule_task(self, task: Task) -> bool:
-        """Schedule or reschedule a task."""
-        job_id = f"task_{task.id}"
+        if self._warm_task:
+            self._warm_task.cancel()
+            self._warm_task = None
 
-        # Remove existing job if any
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
+        await agent_executor.close()
+        await browser_pool.close()
 
-        if not task.is_enabled:
-            return False
+        if not self.scheduler.running:
+            return
+        self.scheduler.shutdown(wait=False)
+        logger.info("Scheduler stopped")
 
-        # Manual-only tasks (no cron expression) don't get scheduled
-        if not task.cron_expression:
+    def _track_job(self, event: JobEvent) -> None:
+        """Keep track of jobs from submission to completion, before they create a log."""
+        if event.code == EVENT_JOB_SUBMITTED:
+            self._active_jobs.add(event.job_id)
+        else:
+            self._active_jobs.discard(event.job_id)
+
+    async def _poll_job_store(self) -> None:
+        """Periodically pick up jobs that other processes added to the job store."""
+        while True:
+            await asyncio.sleep(settings.scheduler_poll_interval)
+            self.scheduler.wakeup()
+
+    async def schedule_task(self, task: Task, db: AsyncSession | None = None) -> bool:
+        """
+        Schedule or reschedule a task.
+
+        When a session is given the next run time is written through it and
+        committing is left to the caller.
+        """
+        # Disabled and manual-only (no cron expression) tasks have no job
+        if not task.is_enabled or not task.cron_expression:
+            await self.unschedule_task(task.id)
             return False
 
         try:
             # Parse cron expression
             trigger = CronTrigger.from_crontab(task.cron_expression, timezone=task.timezone)
 
-            # Add job
-            job = self.scheduler.add_job(
-                self._execute_task,
+            # Add the job, replacing any existing one; job store calls block, so
+            # they run in a thread like the other job store access
+            job = await asyncio.to_thread(
+                self.scheduler.add_job,
+                execute_task_job,
                 trigger=trigger,
-                id=job_id,
+                id=f"task_{task.id}",
                 args=[task.id],
                 replace_existing=True,
             )
+            self._job_list_cache.clear()
 
             # Update next run time
             if job.next_run_time:
-                async with async_session() as db:
-                    task_service = TaskService(db)
-                    await task_service.update_run_times(
-                        task.id, next_run_at=job.next_run_time.isoformat()
-                    )
-                    await db.commit()
+                next_run_at = _as_naive_utc(job.next_run_time)
+                if db is not None:
+                    await TaskService(db).update_run_times(task.id, next_run_at=next_run_at)
+                else:
+                    async with async_session() as session:
+                        await TaskService(session).update_run_times(
+                            task.id, next_run_at=next_run_at
+                        )
+                        await session.commit()
+                    task_list_cache.clear()
 
             logger.info(f"Scheduled task {task.id} with cron '{task.cron_expression}'")
             return True
@@ -101,13 +214,14 @@ class SchedulerService:
 
     async def unschedule_task(self, task_id: str) -> bool:
         """Remove a task from the scheduler."""
-        job_id = f"task_{task_id}"
+        try:
+            await asyncio.to_thread(self.scheduler.remove_job, f"task_{task_id}")
+        except JobLookupError:
+            return False
 
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
-            logger.info(f"Unscheduled task {task_id}")
-            return True
-        return False
+        self._job_list_cache.clear()
+        logger.info(f"Unscheduled task {task_id}")
+        return True
 
     async def run_now(self, task_id: str) -> str | None:
         """Trigger immediate execution of a task."""
@@ -118,24 +232,49 @@ class SchedulerService:
             if not task:
                 return None
 
-            # Check if already running
-            if task_id in self._running_tasks:
+            # Check if already running, here or in the process executing jobs; a
+            # run that outlived its timeout was interrupted and does not count
+            job_id = f"run_now_{task_id}"
+            started_after = datetime.utcnow() - timedelta(seconds=task.timeout_seconds + 60)
+            if (
+                task_id in self._running_tasks
+                or {job_id, f"task_{task_id}"} & self._active_jobs
+                or await LogService(db).get_running_for_task(task_id, started_after=started_after)
+            ):
                 logger.warning(f"Task {task_id} is already running")
                 return None
 
-            # Execute in background
-            import asyncio
-            asyncio.create_task(self._execute_task(task_id))
+            # A queued one-off job stays in the job store until it is submitted
+            if await asyncio.to_thread(self.scheduler.get_job, job_id):
+                logger.warning(f"Task {task_id} is already queued to run")
+                return None
+
+            # Run through the scheduler as a one-off job so it is tracked and
+            # its errors are logged
+            try:
+                await asyncio.to_thread(
+                    self.scheduler.add_job,
+                    execute_task_job,
+                    trigger="date",
+                    id=job_id,
+                    args=[task_id],
+                    kwargs={"manual": True},
+                    misfire_grace_time=30,
+                )
+                self._job_list_cache.clear()
+            except ConflictingIdError:
+                logger.warning(f"Task {task_id} is already queued to run")
+                return None
 
             return task_id
 
-    async def _execute_task(self, task_id: str) -> None:
-        """Execute a task."""
+    async def _execute_task(self, task_id: str, manual: bool = False) -> None:
+        """Execute a task; manual runs always launch the agent instead of reusing a cached result."""
         async with async_session() as db:
             task_service = TaskService(db)
             log_service = LogService(db)
 
-            task = await task_service.get_by_id(task_id)
+            task = await task_service.get_execution_fields(task_id)
             if not task:
                 logger.error(f"Task {task_id} not found")
                 return
@@ -163,9 +302,11 @@ class SchedulerService:
                 logger.info(f"Executing task {task_id}: {task.name}")
 
                 # Execute the agent
-                status, result_summary, error_message, steps = await agent_executor.execute(task)
+                status, result_summary, error_message, steps = await agent_executor.execute(
+                    task, use_cache=not manual
+                )
 
-                # Update log
+                # Record the result and run times in one transaction
                 log = await log_service.update(
                     log.id,
                     status=status,
@@ -173,21 +314,18 @@ class SchedulerService:
                     error_message=error_message,
                     agent_steps=steps,
                 )
-                await db.commit()
-
-                # Update task last run time
+                job = await self.get_job(task_id)
                 await task_service.update_run_times(
-                    task_id, last_run_at=datetime.utcnow().isoformat()
+                    task_id,
+                    last_run_at=datetime.utcnow(),
+                    next_run_at=(
+                        _as_naive_utc(job.next_run_time)
+                        if job and job.next_run_time
+                        else None
+                    ),
                 )
-
-                # Get next run time
-                job = self.scheduler.get_job(f"task_{task_id}")
-                if job and job.next_run_time:
-                    await task_service.update_run_times(
-                        task_id, next_run_at=job.next_run_time.isoformat()
-                    )
-
                 await db.commit()
+                task_list_cache.clear()
 
                 # Send notification
                 await self._send_notification(task, log)
@@ -197,7 +335,8 @@ class SchedulerService:
             except Exception as e:
                 logger.error(f"Task {task_id} failed: {e}")
 
-                # Update log with error
+                # Discard any partial result before recording the error
+                await db.rollback()
                 await log_service.update(
                     log.id,
                     status=LogStatus.FAILURE,
@@ -225,7 +364,7 @@ class SchedulerService:
                         "status": log.status if log else "unknown",
                     })
 
-    async def _send_notification(self, task: Task, log) -> None:
+    async def _send_notification(self, task: Row, log) -> None:
         """Send notification based on task result."""
         if not task.telegram_enabled:
             return
@@ -253,18 +392,37 @@ class SchedulerService:
                 chat_id,
             )
 
-    def get_job(self, task_id: str) -> Job | None:
-        """Get a scheduled job by task ID."""
-        return self.scheduler.get_job(f"task_{task_id}")
+    async def get_job(self, task_id: str) -> Job | None:
+        """Get a scheduled job by task ID, reading the job store off the event loop."""
+        return await asyncio.to_thread(self.scheduler.get_job, f"task_{task_id}")
 
     def get_running_tasks(self) -> dict[str, str]:
         """Get currently running tasks."""
         return self._running_tasks.copy()
 
-    def get_all_jobs(self) -> list[Job]:
-        """Get all scheduled jobs."""
-        return self.scheduler.get_jobs()
+    async def get_all_jobs(self) -> list[Job]:
+        """Get all scheduled jobs, reusing the last read of the job store for a short time."""
+        jobs = self._job_list_cache.get("jobs")
+        if jobs is None:
+            jobs = await asyncio.to_thread(self.scheduler.get_jobs)
+            self._job_list_cache.set("jobs", jobs)
+        return jobs
+
+    @property
+    def is_running(self) -> bool:
+        """Whether this process is executing scheduled jobs."""
+        return self.scheduler.state == STATE_RUNNING
+
+    @property
+    def is_paused(self) -> bool:
+        """Whether the scheduler only manages the job store for another process."""
+        return self.scheduler.state == STATE_PAUSED
 
 
 # Global instance
 scheduler_service = SchedulerService()
+
+
+async def execute_task_job(task_id: str, manual: bool = False) -> None:
+    """Scheduled job entry point, referenced by name in the persistent job store."""
+    await scheduler_service._execute_task(task_id, manual=manual)
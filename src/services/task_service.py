@@ -1,9 +1,16 @@
 """Task CRUD operations service."""
-from sqlalchemy import select, func
+from datetime import datetime
+
+from sqlalchemy import Row, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import settings
 from src.db.models import Task
 from src.schemas.task import TaskCreate, TaskUpdate
+from src.services.cache import TTLCache
+
+# Task list pages keyed by (page, per_page); clear after committing task changes
+task_list_cache = TTLCache(maxsize=64, ttl=settings.task_list_cache_ttl)
 
 
 class TaskService:
@@ -13,9 +20,11 @@ class TaskService:
         """Initialize with database session."""
         self.db = db
 
-    async def get_all(self) -> list[Task]:
-        """Get all tasks."""
-        result = await self.db.execute(select(Task).order_by(Task.created_at.desc()))
+    async def get_all(self, limit: int | None = None, offset: int = 0) -> list[Task]:
+        """Get all tasks, newest first, optionally paginated."""
+        result = await self.db.execute(
+            select(Task).order_by(Task.created_at.desc()).limit(limit).offset(offset)
+        )
         return list(result.scalars().all())
 
     async def get_by_id(self, task_id: str) -> Task | None:
@@ -23,6 +32,29 @@ class TaskService:
         result = await self.db.execute(select(Task).where(Task.id == task_id))
         return result.scalar_one_or_none()
 
+    async def get_name(self, task_id: str) -> str | None:
+        """Get just a task's name."""
+        return await self.db.scalar(select(Task.name).where(Task.id == task_id))
+
+    async def get_execution_fields(self, task_id: str) -> Row | None:
+        """Get only the task columns needed to run it and send notifications."""
+        result = await self.db.execute(
+            select(
+                Task.id,
+                Task.name,
+                Task.description,
+                Task.start_url,
+                Task.timeout_seconds,
+                Task.cache_ttl_seconds,
+                Task.headless,
+                Task.telegram_enabled,
+                Task.telegram_chat_id,
+                Task.notify_on_success,
+                Task.notify_on_failure,
+            ).where(Task.id == task_id)
+        )
+        return result.one_or_none()
+
     async def get_enabled(self) -> list[Task]:
         """Get all enabled tasks."""
         result = await self.db.execute(
@@ -38,19 +70,23 @@ class TaskService:
         await self.db.refresh(task)
         return task
 
-    async def update(self, task_id: str, task_data: TaskUpdate) -> Task | None:
-        """Update a task."""
+    async def update(self, task_id: str, task_data: TaskUpdate) -> tuple[Task, set[str]] | None:
+        """Update a task, returning it with the names of fields that changed."""
         task = await self.get_by_id(task_id)
         if not task:
             return None
 
+        changed_fields = set()
         update_data = task_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
-            setattr(task, field, value)
+            if getattr(task, field) != value:
+                setattr(task, field, value)
+                changed_fields.add(field)
 
-        await self.db.flush()
-        await self.db.refresh(task)
-        return task
+        if changed_fields:
+            await self.db.flush()
+            await self.db.refresh(task)
+        return task, changed_fields
 
     async def delete(self, task_id: str) -> bool:
         """Delete a task."""
@@ -74,21 +110,22 @@ class TaskService:
         return task
 
     async def update_run_times(
-        self, task_id: str, last_run_at: str | None = None, next_run_at: str | None = None
-    ) -> Task | None:
-        """Update task run times."""
-        task = await self.get_by_id(task_id)
-        if not task:
-            return None
-
+        self,
+        task_id: str,
+        last_run_at: datetime | None = None,
+        next_run_at: datetime | None = None,
+    ) -> bool:
+        """Update task run times in a single statement, returning whether the task exists."""
+        values = {}
         if last_run_at is not None:
-            task.last_run_at = last_run_at
+            values["last_run_at"] = last_run_at
         if next_run_at is not None:
-            task.next_run_at = next_run_at
+            values["next_run_at"] = next_run_at
+        if not values:
+            return False
 
-        await self.db.flush()
-        await self.db.refresh(task)
-        return task
+        result = await self.db.execute(update(Task).where(Task.id == task_id).values(**values))
+        return result.rowcount > 0
 
     async def count(self) -> int:
         """Get total task count."""